@@ -76,6 +76,7 @@ __jina_env__ = (
     'JINA_CONTROL_PORT',
     'JINA_DEFAULT_HOST',
     'JINA_DISABLE_UVLOOP',
+    'JINA_DUMP_COMPRESSION',
     'JINA_EXECUTOR_WORKDIR',
     'JINA_FULL_CLI',
     'JINA_IPC_SOCK_TMP',
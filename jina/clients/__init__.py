@@ -2,6 +2,7 @@
 __copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
+from asyncio import new_event_loop, get_running_loop
 from typing import Union, List
 
 from . import request
@@ -10,6 +11,7 @@ from .helper import callback_exec
 from .request import GeneratorSourceType
 from .websocket import WebSocketClientMixin
 from ..enums import RequestType
+from ..excepts import BadClient
 from ..helper import run_async, deprecated_alias
 
 
@@ -19,6 +21,46 @@ class Client(BaseClient):
     It manages the asyncio event loop internally, so all interfaces are synchronous from the outside.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loop = None
+
+    def __enter__(self):
+        """Keep one connection to the gateway open for all requests sent inside the context.
+
+        :return: this client
+        """
+        if self._loop is not None:
+            raise BadClient(f'{self!r} already keeps a connection open')
+        try:
+            get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # e.g. inside Jupyter, a second loop can not be driven from the running one
+            raise BadClient(
+                f'{self!r} can not keep a connection open while an event loop is already running, '
+                f'use `AsyncClient` or `AsyncFlow` instead'
+            )
+        self._loop = new_event_loop()
+        self._channel = self._loop.run_until_complete(self._open_channel_async())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._loop.run_until_complete(self._channel.close())
+        self._loop.close()
+        self._channel = None
+        self._loop = None
+
+    async def _open_channel_async(self):
+        # the channel is bound to the event loop it is created in
+        return self._open_channel()
+
+    def _run_async(self, func, *args, **kwargs):
+        if self._loop is not None:
+            return self._loop.run_until_complete(func(*args, **kwargs))
+        return run_async(func, *args, **kwargs)
+
     async def _get_results(self, *args, **kwargs):
         result = []
         async for resp in super()._get_results(*args, **kwargs):
@@ -52,7 +94,7 @@ class Client(BaseClient):
         :return: None
         """
         self.mode = RequestType.TRAIN
-        return run_async(
+        return self._run_async(
             self._get_results, inputs, on_done, on_error, on_always, **kwargs
         )
 
@@ -81,7 +123,7 @@ class Client(BaseClient):
         """
         self.mode = RequestType.SEARCH
         self.add_default_kwargs(kwargs)
-        return run_async(
+        return self._run_async(
             self._get_results, inputs, on_done, on_error, on_always, **kwargs
         )
 
@@ -109,7 +151,7 @@ class Client(BaseClient):
         :return: None
         """
         self.mode = RequestType.INDEX
-        return run_async(
+        return self._run_async(
             self._get_results, inputs, on_done, on_error, on_always, **kwargs
         )
 
@@ -137,7 +179,7 @@ class Client(BaseClient):
         :return: None
         """
         self.mode = RequestType.UPDATE
-        return run_async(
+        return self._run_async(
             self._get_results, inputs, on_done, on_error, on_always, **kwargs
         )
 
@@ -165,7 +207,7 @@ class Client(BaseClient):
         :return: None
         """
         self.mode = RequestType.DELETE
-        return run_async(
+        return self._run_async(
             self._get_results, inputs, on_done, on_error, on_always, **kwargs
         )
 
@@ -192,7 +234,7 @@ class Client(BaseClient):
         kwargs['targets'] = targets
 
         self.mode = RequestType.CONTROL
-        return run_async(
+        return self._run_async(
             self._get_results,
             [],
             on_done,
@@ -243,3 +285,9 @@ class WebSocketClient(Client, WebSocketClientMixin):
 
     :class:`WebSocketClient` internally handles an event loop to run operations asynchronously.
     """
+
+    def __enter__(self):
+        raise BadClient(
+            f'{self!r} opens a new websocket for every request, '
+            f'a persistent connection is only supported by the gRPC `Client`'
+        )
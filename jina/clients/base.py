@@ -4,6 +4,7 @@ __license__ = "Apache-2.0"
 
 import argparse
 import os
+from contextlib import AsyncExitStack
 from typing import Callable, Union, Optional, Iterator, Iterable, Dict, AsyncIterator
 import asyncio
 
@@ -47,6 +48,7 @@ class BaseClient:
             os.unsetenv('https_proxy')
         self._mode = args.mode
         self._inputs = None
+        self._channel = None
 
     @property
     def mode(self) -> str:
@@ -155,6 +157,15 @@ class BaseClient:
         else:
             self._inputs = bytes_gen
 
+    def _open_channel(self) -> 'grpc.aio.Channel':
+        return grpc.aio.insecure_channel(
+            f'{self.args.host}:{self.args.port_expose}',
+            options=[
+                ('grpc.max_send_message_length', -1),
+                ('grpc.max_receive_message_length', -1),
+            ],
+        )
+
     async def _get_results(
         self,
         inputs: InputType,
@@ -167,13 +178,12 @@ class BaseClient:
             self.inputs = inputs
             tname = self._get_task_name(kwargs)
             req_iter = self._get_requests(**kwargs)
-            async with grpc.aio.insecure_channel(
-                f'{self.args.host}:{self.args.port_expose}',
-                options=[
-                    ('grpc.max_send_message_length', -1),
-                    ('grpc.max_receive_message_length', -1),
-                ],
-            ) as channel:
+            async with AsyncExitStack() as stack:
+                # reuse the connection if this client keeps one open, otherwise open one for this call only
+                if self._channel is None:
+                    channel = await stack.enter_async_context(self._open_channel())
+                else:
+                    channel = self._channel
                 stub = jina_pb2_grpc.JinaRPCStub(channel)
                 self.logger.success(
                     f'connected to the gateway at {self.args.host}:{self.args.port_expose}!'
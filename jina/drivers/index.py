@@ -1,13 +1,15 @@
 __copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
 __license__ = "Apache-2.0"
 
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
 from . import BaseExecutableDriver, FlatRecursiveMixin
 from ..enums import EmbeddingClsType
+from ..proto import jina_pb2
 
 if False:
     from ..types.arrays import DocumentArray
+    from ..types.document import Document
 
 
 class BaseIndexDriver(FlatRecursiveMixin, BaseExecutableDriver):
@@ -76,18 +78,11 @@ class DBMSIndexDriver(BaseIndexDriver):
     """Forwards ids, vectors, serialized Document to a BaseDBMSIndexer"""
 
     def _apply_all(self, docs: 'DocumentArray', *args, **kwargs) -> None:
-        info = [
-            (
-                doc.id,
-                doc.embedding,
-                self._doc_without_embedding(doc).SerializeToString(),
-            )
-            for doc in docs
-        ]
+        info = [(doc.id, doc.embedding) for doc in docs]
         if info:
-            ids, vecs, metas = zip(*info)
+            ids, vecs = zip(*info)
             self.check_key_length(ids)
-            self.exec_fn(ids, vecs, metas)
+            self.exec_fn(ids, vecs, self._serialize_docs_without_embedding(docs))
 
     @staticmethod
     def _doc_without_embedding(d):
@@ -96,3 +91,21 @@ class DBMSIndexDriver(BaseIndexDriver):
         new_doc = Document(d, copy=True)
         new_doc.ClearField('embedding')
         return new_doc
+
+    @staticmethod
+    def _serialize_docs_without_embedding(docs: Iterable['Document']) -> List[bytes]:
+        """Serialize a batch of Documents without their embeddings.
+
+        Equivalent to calling :meth:`_doc_without_embedding` and ``SerializeToString`` on each
+        Document, but reuses a single scratch proto instead of building a new Document per item.
+
+        :param docs: the Documents to serialize
+        :return: the serialized Documents, in the same order
+        """
+        scratch = jina_pb2.DocumentProto()
+        serialized = []
+        for doc in docs:
+            scratch.CopyFrom(doc.proto)
+            scratch.ClearField('embedding')
+            serialized.append(scratch.SerializeToString())
+        return serialized
@@ -1,10 +1,26 @@
+import importlib
+import json
 import os
+import shutil
 import sys
-from typing import Tuple, Generator, BinaryIO, TextIO
+from typing import Tuple, Generator, BinaryIO, TextIO, Union
 
 import numpy as np
 
+from ...enums import CompressAlgo
+from ...importer import ImportExtensions
+
 BYTE_PADDING = 4
+COMPRESSED_VECTORS_FILENAME = 'vectors.compressed'
+COMPRESSED_CHUNK_BYTES = 1 << 20
+
+_COMPRESS_MODULES = {
+    CompressAlgo.LZ4: 'lz4.frame',
+    CompressAlgo.ZLIB: 'zlib',
+    CompressAlgo.GZIP: 'gzip',
+    CompressAlgo.BZ2: 'bz2',
+    CompressAlgo.LZMA: 'lzma',
+}
 
 
 def export_dump_streaming(
@@ -19,6 +35,12 @@ def export_dump_streaming(
     :param shards: the nr of shards this pea is part of
     :param size: total amount of entries
     :param data: the generator of the data (ids, vectors, metadata)
+
+    .. note::
+        Set ``JINA_DUMP_COMPRESSION`` to one of :class:`CompressAlgo` (e.g. ``LZ4``) to store the vectors
+        of each shard as byte-shuffled, compressed chunks instead of raw records.
+        All vectors must then have the same dimension.
+        LZ4 requires additional package, to install it use pip install "jina[lz4]"
     """
     _handle_dump(data, path, shards, size)
 
@@ -34,12 +56,17 @@ def _handle_dump(
     size_per_shard = size // shards
     extra = size % shards
     shard_range = list(range(shards))
-    for shard_id in shard_range:
-        if shard_id == shard_range[-1]:
-            size_this_shard = size_per_shard + extra
-        else:
-            size_this_shard = size_per_shard
-        _write_shard_data(data, path, shard_id, size_this_shard)
+    try:
+        for shard_id in shard_range:
+            if shard_id == shard_range[-1]:
+                size_this_shard = size_per_shard + extra
+            else:
+                size_this_shard = size_per_shard
+            _write_shard_data(data, path, shard_id, size_this_shard)
+    except Exception:
+        # do not leave a partial dump behind
+        shutil.rmtree(path, ignore_errors=True)
+        raise
 
 
 def _write_shard_data(
@@ -52,11 +79,16 @@ def _write_shard_data(
     shard_docs_written = 0
     os.makedirs(shard_path)
     vectors_fp, metas_fp, ids_fp = _get_file_paths(shard_path)
-    with open(vectors_fp, 'wb') as vectors_fh, open(metas_fp, 'wb') as metas_fh, open(
-        ids_fp, 'w'
-    ) as ids_fh:
+    compress_algo = _get_dump_compression()
+    if compress_algo == CompressAlgo.NONE:
+        vectors_writer = _RawVectorsWriter(vectors_fp)
+    else:
+        vectors_writer = _CompressedVectorsWriter(
+            os.path.join(shard_path, COMPRESSED_VECTORS_FILENAME), compress_algo
+        )
+    with vectors_writer, open(metas_fp, 'wb') as metas_fh, open(ids_fp, 'w') as ids_fh:
         while shard_docs_written < size_this_shard:
-            _write_shard_files(data, ids_fh, metas_fh, vectors_fh)
+            _write_shard_files(data, ids_fh, metas_fh, vectors_writer)
             shard_docs_written += 1
 
 
@@ -64,28 +96,174 @@ def _write_shard_files(
     data: Generator[Tuple[str, np.array, bytes], None, None],
     ids_fh: TextIO,
     metas_fh: BinaryIO,
-    vectors_fh: BinaryIO,
+    vectors_writer: Union['_RawVectorsWriter', '_CompressedVectorsWriter'],
 ):
     id_, vec, meta = next(data)
-    vec_bytes = vec.tobytes()
-    vectors_fh.write(len(vec_bytes).to_bytes(BYTE_PADDING, sys.byteorder) + vec_bytes)
+    vectors_writer.write(id_, vec)
     metas_fh.write(len(meta).to_bytes(BYTE_PADDING, sys.byteorder) + meta)
     ids_fh.write(id_ + '\n')
 
 
-def import_vectors(path: str, pea_id: str):
+class _RawVectorsWriter:
+    """Writes every vector as a record of its size in bytes followed by its bytes"""
+
+    def __init__(self, vectors_fp: str):
+        self._vectors_fh = open(vectors_fp, 'wb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._vectors_fh.close()
+
+    def write(self, id_: str, vec: np.ndarray):
+        vec_bytes = vec.tobytes()
+        self._vectors_fh.write(
+            len(vec_bytes).to_bytes(BYTE_PADDING, sys.byteorder) + vec_bytes
+        )
+
+
+class _CompressedVectorsWriter:
+    """Writes the vectors as a stream of byte-shuffled, compressed chunks of about
+    :data:`COMPRESSED_CHUNK_BYTES` each.
+
+    The file starts with a header (compression, dtype and dimension of the vectors), followed by
+    one frame per chunk: the nr of rows, the size of the compressed chunk and the compressed chunk.
+    All vectors must have the dimension of the first one.
+    """
+
+    def __init__(self, compressed_fp: str, compress_algo: CompressAlgo):
+        self._compressed_fh = open(compressed_fp, 'wb')
+        self._compress_algo = compress_algo
+        self._compress_module = _get_compress_module(compress_algo)
+        self._chunk = None
+        self._chunk_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                if self._chunk is None:
+                    # empty shard, the header is still needed to tell the format
+                    self._write_header(np.dtype(np.float64), 0)
+                self._flush()
+        finally:
+            self._compressed_fh.close()
+
+    def write(self, id_: str, vec: np.ndarray):
+        if self._chunk is None:
+            dim = vec.shape[0]
+            self._write_header(vec.dtype, dim)
+            row_bytes = max(dim * vec.dtype.itemsize, 1)
+            self._chunk = np.empty(
+                (max(COMPRESSED_CHUNK_BYTES // row_bytes, 1), dim), dtype=vec.dtype
+            )
+        if vec.shape != self._chunk.shape[1:] or vec.dtype != self._chunk.dtype:
+            raise ValueError(
+                f'vector of document {id_} has shape {vec.shape} and dtype {vec.dtype}, but compressed dumps '
+                f'require all vectors to have the shape {self._chunk.shape[1:]} and dtype {self._chunk.dtype}. '
+                f'Dump with JINA_DUMP_COMPRESSION=NONE instead'
+            )
+        self._chunk[self._chunk_rows] = vec
+        self._chunk_rows += 1
+        if self._chunk_rows == self._chunk.shape[0]:
+            self._flush()
+
+    def _write_header(self, dtype: np.dtype, dim: int):
+        header = json.dumps(
+            {
+                'compression': str(self._compress_algo),
+                'dtype': dtype.str,
+                'dim': dim,
+            }
+        ).encode()
+        self._compressed_fh.write(
+            len(header).to_bytes(BYTE_PADDING, sys.byteorder) + header
+        )
+
+    def _flush(self):
+        if not self._chunk_rows:
+            return
+        rows = self._chunk[: self._chunk_rows]
+        # byte-shuffle: group the i-th byte of all values together, which compresses far better for floats
+        shuffled = rows.view(np.uint8).reshape(-1, rows.dtype.itemsize).T.tobytes()
+        compressed = self._compress_module.compress(shuffled)
+        self._compressed_fh.write(
+            self._chunk_rows.to_bytes(BYTE_PADDING, sys.byteorder)
+            + len(compressed).to_bytes(BYTE_PADDING, sys.byteorder)
+            + compressed
+        )
+        self._chunk_rows = 0
+
+
+def _get_dump_compression() -> CompressAlgo:
+    return CompressAlgo.from_string(os.environ.get('JINA_DUMP_COMPRESSION', 'NONE'))
+
+
+def _get_compress_module(compress_algo: CompressAlgo):
+    with ImportExtensions(required=True):
+        return importlib.import_module(_COMPRESS_MODULES[compress_algo])
+
+
+def _compressed_chunks(compressed_fp: str) -> Generator[np.ndarray, None, None]:
+    with open(compressed_fp, 'rb') as compressed_fh:
+        header_size = int.from_bytes(
+            compressed_fh.read(BYTE_PADDING), byteorder=sys.byteorder
+        )
+        header = json.loads(compressed_fh.read(header_size))
+        compress_module = _get_compress_module(
+            CompressAlgo.from_string(header['compression'])
+        )
+        dtype = np.dtype(header['dtype'])
+        while True:
+            frame = compressed_fh.read(2 * BYTE_PADDING)
+            if not frame:
+                break
+            rows = int.from_bytes(frame[:BYTE_PADDING], byteorder=sys.byteorder)
+            compressed_size = int.from_bytes(
+                frame[BYTE_PADDING:], byteorder=sys.byteorder
+            )
+            shuffled = compress_module.decompress(compressed_fh.read(compressed_size))
+            yield np.frombuffer(shuffled, dtype=np.uint8).reshape(
+                dtype.itemsize, -1
+            ).T.copy().view(dtype).reshape(rows, header['dim'])
+
+
+def import_vectors(path: str, pea_id: str, return_array: bool = False):
     """Import id and vectors
 
     :param path: the path to the dump
     :param pea_id: the id of the pea (as part of the shards)
-    :return: the generators for the ids and for the vectors
+    :param return_array: if set, return the ids as a `np.ndarray` and the vectors as a 2-D `np.ndarray`
+        instead of generators. For raw dumps the vectors are a read-only view memory-mapped from disk and
+        all vectors must have the same dimension, else a `ValueError` is raised; for compressed dumps they are decompressed into memory.
+    :return: the generators for the ids and for the vectors, or two `np.ndarray` if ``return_array`` is set.
+        An empty shard gives vectors of shape ``(0, 0)``.
+
+    .. note::
+        Raw dumps do not store the dtype, their vectors are always read as ``float64``.
+        Compressed dumps keep the dtype of the dumped vectors.
     """
     path = os.path.join(path, pea_id)
+    if return_array:
+        return _ids_array(path), _vecs_array(path)
     ids_gen = _ids_gen(path)
     vecs_gen = _vecs_gen(path)
     return ids_gen, vecs_gen
 
 
+def import_vectors_array(path: str, pea_id: str) -> np.ndarray:
+    """Import only the vectors as a 2-D `np.ndarray`, without reading the ids
+
+    :param path: the path to the dump
+    :param pea_id: the id of the pea (as part of the shards)
+    :return: the vectors, as returned by :func:`import_vectors` with ``return_array`` set
+    """
+    return _vecs_array(os.path.join(path, pea_id))
+
+
 def import_metas(path: str, pea_id: str):
     """Import id and metadata
 
@@ -106,6 +284,11 @@ def _ids_gen(path: str):
 
 
 def _vecs_gen(path: str):
+    compressed_fp = os.path.join(path, COMPRESSED_VECTORS_FILENAME)
+    if os.path.exists(compressed_fp):
+        for chunk in _compressed_chunks(compressed_fp):
+            yield from chunk
+        return
     with open(os.path.join(path, 'vectors'), 'rb') as vectors_fh:
         while True:
             next_size = vectors_fh.read(BYTE_PADDING)
@@ -120,6 +303,44 @@ def _vecs_gen(path: str):
                 break
 
 
+def _ids_array(path: str) -> np.ndarray:
+    return np.array(list(_ids_gen(path)), dtype=str)
+
+
+def _vecs_array(path: str) -> np.ndarray:
+    compressed_fp = os.path.join(path, COMPRESSED_VECTORS_FILENAME)
+    if os.path.exists(compressed_fp):
+        chunks = list(_compressed_chunks(compressed_fp))
+        if not chunks:
+            return np.empty((0, 0), dtype=np.float64)
+        return np.concatenate(chunks)
+    vectors_fp = os.path.join(path, 'vectors')
+    if not os.path.getsize(vectors_fp):
+        return np.empty((0, 0), dtype=np.float64)
+    return _vecs_records(np.memmap(vectors_fp, dtype=np.uint8, mode='r'))
+
+
+def _vecs_records(buffer) -> np.ndarray:
+    first_size = int.from_bytes(buffer[:BYTE_PADDING], byteorder=sys.byteorder)
+    if not first_size:
+        return np.empty((0, 0), dtype=np.float64)
+    # every record is the size prefix followed by the vector bytes,
+    # so the buffer can be viewed as an array of fixed-size records.
+    # like `_vecs_gen`, this assumes the vectors were dumped as float64
+    dim = first_size // np.dtype(np.float64).itemsize
+    record = np.dtype([('size', f'u{BYTE_PADDING}'), ('vec', np.float64, (dim,))])
+    mixed_dims_error = ValueError(
+        f'vectors in the dump do not all have the dimension {dim} of the first one, '
+        f'read them with `import_vectors(..., return_array=False)` instead'
+    )
+    if len(buffer) % record.itemsize:
+        raise mixed_dims_error
+    records = np.frombuffer(buffer, dtype=record)
+    if not (records['size'] == first_size).all():
+        raise mixed_dims_error
+    return records['vec']
+
+
 def _metas_gen(path: str):
     with open(os.path.join(path, 'metas'), 'rb') as metas_fh:
         while True:
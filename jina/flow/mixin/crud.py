@@ -7,10 +7,32 @@ from ...clients.base import InputType, InputDeleteType, CallbackFnType
 from ...enums import DataInputType
 from ...helper import deprecated_alias
 
+if False:
+    from ...clients import Client
+
 
 class CRUDFlowMixin:
     """The synchronous version of the Mixin for CRUD in Flow"""
 
+    def persistent_client(self, **kwargs) -> 'Client':
+        """Get a client which keeps one connection to the gateway open while used as a context manager.
+
+        Use it when sending many small requests, e.g.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            with f.persistent_client() as client:
+                for d in docs:
+                    client.search(d)
+
+        Only the gRPC client supports this, entering the client of a ``rest_api`` Flow raises :class:`BadClient`.
+
+        :param kwargs: accepts all keyword arguments of `jina client` CLI
+        :return: the client
+        """
+        return self._get_client(**kwargs)
+
     @deprecated_alias(input_fn=('inputs', 0))
     def train(
         self,
@@ -1,23 +1,32 @@
 import os
-from pathlib import Path
+from operator import attrgetter
 
 import numpy as np
 import pytest
 
 from jina import Flow, Document
 from jina.drivers.index import DBMSIndexDriver
-from jina.executors.indexers.dump import import_vectors, import_metas
+from jina.executors.indexers.dump import (
+    import_vectors,
+    import_vectors_array,
+    import_metas,
+)
 from jina.executors.indexers.query import BaseQueryIndexer
 from jina.executors.indexers.query.compound import CompoundQueryExecutor
 from jina.logging.profile import TimeContext
 
+_get_id = attrgetter('id')
+_get_embedding = attrgetter('embedding')
+
 
-def get_documents(nr=10, index_start=0, emb_size=7):
-    for i in range(index_start, nr + index_start):
+def get_documents(nr=10, index_start=0, emb_size=7, seed=1234):
+    # seeded, so that the same arguments always give the same Documents
+    embeddings = np.random.default_rng(seed).random((nr, emb_size))
+    for i, emb in zip(range(index_start, nr + index_start), embeddings):
         with Document() as d:
             d.id = i
             d.text = f'hello world {i}'
-            d.embedding = np.random.random(emb_size)
+            d.embedding = emb
             d.tags['tag_field'] = f'tag data {i}'
         yield d
 
@@ -28,6 +37,7 @@ def basic_benchmark(tmpdir, docs, validate_results_nonempty, error_callback, nr_
     with Flow().add(uses='basic/query.yml') as flow:
         flow.index(docs)
 
+    # the indexers only become queryable once they are persisted and reloaded
     with Flow().add(uses='basic/query.yml') as flow:
         with TimeContext(
             f'### baseline - query time with {nr_search} on {len(docs)} docs'
@@ -43,38 +53,48 @@ def basic_benchmark(tmpdir, docs, validate_results_nonempty, error_callback, nr_
             flow_dbms.index(docs)
 
 
-def assert_dump_data(dump_path, docs, shards, pea_id):
-    size_shard = len(docs) // shards
-    size_shard_modulus = len(docs) % shards
-    ids_dump, vectors_dump = import_vectors(
-        dump_path,
-        str(pea_id),
-    )
-    if pea_id == shards - 1:
-        docs_expected = docs[
-            (pea_id) * size_shard : (pea_id + 1) * size_shard + size_shard_modulus
-        ]
-    else:
-        docs_expected = docs[(pea_id) * size_shard : (pea_id + 1) * size_shard]
+def _shard_ranges(size, shards):
+    # same split as the dump: the last shard takes the remainder
+    size_shard, size_shard_modulus = divmod(size, shards)
+    return [
+        (
+            pea_id * size_shard,
+            (pea_id + 1) * size_shard
+            + (size_shard_modulus if pea_id == shards - 1 else 0),
+        )
+        for pea_id in range(shards)
+    ]
+
+
+def _load_vectors(dump_path, pea_id):
+    return import_vectors_array(dump_path, str(pea_id))
+
+
+def assert_dump_data(dump_path, docs_expected, metas_expected, pea_id):
     print(f'### pea {pea_id} has {len(docs_expected)} docs')
 
+    # only the ids are read here, the vectors generator is never started
+    ids_dump, _ = import_vectors(dump_path, str(pea_id))
     ids_dump = list(ids_dump)
-    vectors_dump = list(vectors_dump)
-    np.testing.assert_equal(ids_dump, [d.id for d in docs_expected])
-    np.testing.assert_allclose(vectors_dump, [d.embedding for d in docs_expected])
+    assert len(ids_dump) == len(docs_expected)
+    np.testing.assert_equal(ids_dump, list(map(_get_id, docs_expected)))
+
+    # the dump round trip does no float arithmetic, so the vectors must match exactly
+    vectors_dump = _load_vectors(dump_path, pea_id)
+    if not docs_expected:
+        # an empty shard has no embedding size to compare the shape with
+        assert vectors_dump.size == 0
+    else:
+        assert np.array_equal(
+            vectors_dump, np.stack(list(map(_get_embedding, docs_expected)))
+        )
 
     _, metas_dump = import_metas(
         dump_path,
         str(pea_id),
     )
     metas_dump = list(metas_dump)
-    np.testing.assert_equal(
-        metas_dump,
-        [
-            DBMSIndexDriver._doc_without_embedding(d).SerializeToString()
-            for d in docs_expected
-        ],
-    )
+    np.testing.assert_equal(metas_dump, metas_expected)
 
     # assert with Indexers
     # TODO currently metas are only passed to the parent Compound, not to the inner components
@@ -92,35 +112,50 @@ def assert_dump_data(dump_path, docs, shards, pea_id):
         assert c.size == len(docs_expected)
 
     # test with the inner indexers separate from the Compound
+    dump_path_real = os.path.realpath(dump_path)
     for i, indexer_file in enumerate(['basic/query_np.yml', 'basic/query_kv.yml']):
         indexer = BaseQueryIndexer.load_config(
             indexer_file,
             pea_id=pea_id,
             metas={
-                'workspace': os.path.realpath(os.path.join(dump_path, f'new_ws-{i}')),
+                'workspace': os.path.join(dump_path_real, f'new_ws-{i}'),
                 'dump_path': dump_path,
             },
         )
         assert indexer.size == len(docs_expected)
 
 
+def _file_sizes(path):
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _file_sizes(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.stat(follow_symlinks=False).st_size
+
+
 def path_size(dump_path):
-    dir_size = (
-        sum(f.stat().st_size for f in Path(dump_path).glob('**/*') if f.is_file()) / 1e6
-    )
+    dir_size = sum(_file_sizes(dump_path)) / 1e6
     return dir_size
 
 
-@pytest.mark.parametrize('shards', [6, 3, 1])
+@pytest.fixture
+def dump_env(monkeypatch, tmpdir, shards):
+    monkeypatch.setenv('USES_AFTER', '_merge_matches' if shards > 1 else '_pass')
+    monkeypatch.setenv('SHARDS', str(shards))
+    monkeypatch.setenv('DBMS_WORKSPACE', os.path.join(str(tmpdir), 'index_ws'))
+
+
+@pytest.mark.usefixtures('dump_env')
+@pytest.mark.parametrize('shards', [8, 6, 3, 1])
 @pytest.mark.parametrize('nr_docs', [7])
 @pytest.mark.parametrize('emb_size', [10])
 def test_dump_keyvalue(tmpdir, shards, nr_docs, emb_size, run_basic=False):
-    docs = list(get_documents(nr=nr_docs, index_start=0, emb_size=emb_size))
-    assert len(docs) == nr_docs
-    nr_search = 1
+    def _get_documents():
+        # seeded, every call yields the same Documents
+        return get_documents(nr=nr_docs, index_start=0, emb_size=emb_size)
 
-    os.environ['USES_AFTER'] = '_merge_matches' if shards > 1 else '_pass'
-    os.environ['SHARDS'] = str(shards)
+    nr_search = 1
 
     def _validate_results_nonempty(resp):
         assert len(resp.docs) == nr_search
@@ -130,46 +165,53 @@ def test_dump_keyvalue(tmpdir, shards, nr_docs, emb_size, run_basic=False):
             else:
                 # TODO does it return all of them no matter how many?
                 assert len(d.matches) > 0
-            for m in d.matches:
-                assert m.embedding.shape[0] == emb_size
-                assert (
-                    DBMSIndexDriver._doc_without_embedding(m).SerializeToString()
-                    is not None
-                )
-                assert 'hello world' in m.text
-                assert f'tag data' in m.tags['tag_field']
+            embeddings = np.stack(list(map(_get_embedding, d.matches)))
+            assert embeddings.shape == (len(d.matches), emb_size)
+            assert all('hello world' in m.text for m in d.matches)
+            assert all('tag data' in m.tags['tag_field'] for m in d.matches)
 
     def error_callback(resp):
         raise Exception('error callback called')
 
     if run_basic:
         basic_benchmark(
-            tmpdir, docs, _validate_results_nonempty, error_callback, nr_search
+            tmpdir,
+            list(_get_documents()),
+            _validate_results_nonempty,
+            error_callback,
+            nr_search,
         )
 
     dump_path = os.path.join(str(tmpdir), 'dump_dir')
-    os.environ['DBMS_WORKSPACE'] = os.path.join(str(tmpdir), 'index_ws')
     with Flow.load_config('flow_dbms.yml') as flow_dbms:
-        with TimeContext(f'### indexing {len(docs)} docs'):
-            flow_dbms.index(docs)
+        with TimeContext(f'### indexing {nr_docs} docs'):
+            flow_dbms.index(_get_documents())
 
-        with TimeContext(f'### dumping {len(docs)} docs'):
+        with TimeContext(f'### dumping {nr_docs} docs'):
             flow_dbms.dump('indexer_dbms', dump_path, shards=shards, timeout=-1)
 
         dir_size = path_size(dump_path)
         print(f'### dump path size: {dir_size} MBs')
 
     # assert data dumped is correct
-    for pea_id in range(shards):
-        assert_dump_data(dump_path, docs, shards, pea_id)
+    docs = list(_get_documents())
+    assert len(docs) == nr_docs
+    metas = DBMSIndexDriver._serialize_docs_without_embedding(docs)
+    shard_ranges = _shard_ranges(len(docs), shards)
+    # shards are verified one after another: the Flows above already used gRPC,
+    # so forking worker processes here is unsafe
+    for pea_id, (start, end) in enumerate(shard_ranges):
+        assert_dump_data(dump_path, docs[start:end], metas[start:end], pea_id)
 
 
 # benchmark only
 @pytest.mark.skipif(
     'GITHUB_WORKFLOW' in os.environ, reason='skip the benchmark test on github workflow'
 )
-def test_benchmark(tmpdir):
+@pytest.mark.usefixtures('dump_env')
+@pytest.mark.parametrize('shards', [1])
+def test_benchmark(tmpdir, shards):
     nr_docs = 100000
     return test_dump_keyvalue(
-        tmpdir, shards=1, nr_docs=nr_docs, emb_size=128, run_basic=True
+        tmpdir, shards=shards, nr_docs=nr_docs, emb_size=128, run_basic=True
     )
@@ -8,6 +8,9 @@ from jina.flow import Flow
 
 cur_dir = os.path.dirname(os.path.abspath(__file__))
 
+# row i is the embedding of `get_doc(i)`, built once for all the searches
+_EMBEDDINGS = np.repeat(np.arange(1000, dtype=np.float32)[:, None], 5, axis=1)
+
 
 @pytest.fixture
 def config(tmpdir):
@@ -17,7 +20,16 @@ def config(tmpdir):
 
 
 def get_doc(i):
-    return Document(text=f'doc {i}', embedding=np.array([i] * 5))
+    # the table only covers the indices the tests commonly use
+    embedding = (
+        _EMBEDDINGS[i] if i < len(_EMBEDDINGS) else np.full(5, i, dtype=np.float32)
+    )
+    return Document(text=f'doc {i}', embedding=embedding)
+
+
+def get_docs(n):
+    for i in range(n):
+        yield get_doc(i)
 
 
 def test_normal(config):
@@ -27,7 +39,7 @@ def test_normal(config):
     used_replicas = []
 
     def handle_search_result(resp):
-        used_replicas.append(list(resp.search.docs)[0].matches[0].score.value)
+        used_replicas.append(resp.search.docs[0].matches[0].score.value)
 
     flow = Flow().add(
         name='pod1',
@@ -54,11 +66,11 @@ def test_simple_run():
         replicas=2,
         parallel=3,
     )
-    with flow:
+    with flow, flow.persistent_client() as client:
         # test rolling update does not hang
-        flow.search(get_doc(0))
+        client.search(get_doc(0))
         flow.rolling_update('pod1')
-        flow.search(get_doc(1))
+        client.search(get_doc(1))
 
 
 def test_thread_run():
@@ -73,8 +85,7 @@ def test_thread_run():
         # TODO remove the join to make it asynchronous again
         x.join()
         # TODO there is a problem with the gateway even after request times out - open issue
-        for i in range(600):
-            flow.search(get_doc(i))
+        flow.search(get_docs(600), request_size=64)
 
 
 def test_vector_indexer_thread(config):
@@ -83,16 +94,14 @@ def test_vector_indexer_thread(config):
         uses=os.path.join(cur_dir, 'yaml/mock_index_vector.yml'),
         replicas=2,
         parallel=3,
-    ) as flow:
-        for i in range(5):
-            flow.search(get_doc(i))
+    ) as flow, flow.persistent_client() as client:
+        client.search(get_docs(5))
         x = threading.Thread(target=flow.rolling_update, args=('pod1',))
         x.start()
         # TODO there is a problem with the gateway even after request times out - open issue
         # TODO remove the join to make it asynchronous again
         x.join()
-        for i in range(40):
-            flow.search(get_doc(i))
+        client.search(get_docs(40), request_size=8)
 
 
 def test_workspace(config, tmpdir):
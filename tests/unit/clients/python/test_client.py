@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 
@@ -6,7 +7,7 @@ import requests
 
 from jina.clients import Client, WebSocketClient
 from jina.clients.sugary_io import _input_files
-from jina.excepts import BadClientInput
+from jina.excepts import BadClient, BadClientInput
 from jina.flow import Flow
 from jina import helper, Document
 from jina.parsers import set_gateway_parser, set_client_cli_parser
@@ -149,3 +150,41 @@ def test_client_websocket(mocker, flow_with_rest_api_enabled):
             iter([()]), request_size=1, on_always=mock, on_error=mock, on_done=mock
         )
         mock.assert_not_called()
+
+
+def test_persistent_client(mocker, flow):
+    with flow, flow.persistent_client() as client:
+        channel = client._channel
+        assert channel is not None
+        mock = mocker.Mock()
+        for _ in range(3):
+            client.search(iter([Document()]), on_done=mock)
+        assert client._channel is channel
+        assert mock.call_count == 3
+    assert client._channel is None
+
+
+def test_persistent_client_enter_twice(flow):
+    with flow, flow.persistent_client() as client:
+        channel = client._channel
+        with pytest.raises(BadClient):
+            with client:
+                pass
+        assert client._channel is channel
+
+
+def test_persistent_client_rest_api(flow_with_rest_api_enabled):
+    client = flow_with_rest_api_enabled.build().persistent_client()
+    assert isinstance(client, WebSocketClient)
+    with pytest.raises(BadClient):
+        with client:
+            pass
+
+
+def test_persistent_client_running_loop(flow):
+    async def enter_client():
+        with flow.persistent_client():
+            pass
+
+    with flow, pytest.raises(BadClient):
+        asyncio.run(enter_client())
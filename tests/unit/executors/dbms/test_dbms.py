@@ -43,3 +43,10 @@ def test_dbms_keyvalue(tmpdir, test_metas):
     with BaseDBMSIndexer.load(save_path) as indexer:
         indexer.delete([d.id for d in docs])
         assert indexer.size == 0
+
+
+def test_serialize_docs_without_embedding():
+    docs = list(get_documents(chunks=False, nr=10, same_content=False))
+    assert DBMSIndexDriver._serialize_docs_without_embedding(docs) == [
+        DBMSIndexDriver._doc_without_embedding(doc).SerializeToString() for doc in docs
+    ]
@@ -0,0 +1,113 @@
+import os
+
+import numpy as np
+import pytest
+
+from jina.executors.indexers import dump
+from jina.executors.indexers.dump import (
+    export_dump_streaming,
+    import_vectors,
+    import_vectors_array,
+)
+
+
+@pytest.mark.parametrize('shards', [1, 3])
+def test_import_vectors_return_array(tmpdir, shards):
+    nr = 7
+    dump_path = os.path.join(str(tmpdir), 'dump')
+    vecs = np.random.random((nr, 5))
+    export_dump_streaming(
+        dump_path,
+        shards=shards,
+        size=nr,
+        data=((str(i), vecs[i], f'meta {i}'.encode()) for i in range(nr)),
+    )
+    ids_all, vecs_all = [], []
+    for pea_id in range(shards):
+        ids_gen, vecs_gen = import_vectors(dump_path, str(pea_id))
+        ids_arr, vecs_arr = import_vectors(dump_path, str(pea_id), return_array=True)
+        assert isinstance(ids_arr, np.ndarray)
+        np.testing.assert_equal(ids_arr, list(ids_gen))
+        np.testing.assert_equal(vecs_arr, list(vecs_gen))
+        np.testing.assert_equal(import_vectors_array(dump_path, str(pea_id)), vecs_arr)
+        ids_all.extend(ids_arr)
+        vecs_all.extend(vecs_arr)
+    assert ids_all == [str(i) for i in range(nr)]
+    np.testing.assert_equal(vecs_all, vecs)
+
+
+# the records of (4, 1, 1, 1) fill whole records of the first vector's size, (4, 2) does not
+@pytest.mark.parametrize('dims', [(4, 1, 1, 1), (4, 2)])
+def test_import_vectors_return_array_different_dims(tmpdir, dims):
+    dump_path = os.path.join(str(tmpdir), 'dump')
+    export_dump_streaming(
+        dump_path,
+        shards=1,
+        size=len(dims),
+        data=((str(i), np.ones(dim), b'') for i, dim in enumerate(dims)),
+    )
+    with pytest.raises(ValueError, match='return_array=False'):
+        import_vectors(dump_path, '0', return_array=True)
+    _, vecs_gen = import_vectors(dump_path, '0')
+    assert [len(vec) for vec in vecs_gen] == list(dims)
+
+
+@pytest.mark.parametrize('chunk_bytes', [1 << 20, 64])
+@pytest.mark.parametrize('compression', ['LZ4', 'ZLIB', 'LZMA'])
+def test_dump_compressed_vectors(tmpdir, monkeypatch, compression, chunk_bytes):
+    monkeypatch.setenv('JINA_DUMP_COMPRESSION', compression)
+    # 64 bytes fit only one vector, so every vector goes into its own chunk
+    monkeypatch.setattr(dump, 'COMPRESSED_CHUNK_BYTES', chunk_bytes)
+    nr = 10
+    dump_path = os.path.join(str(tmpdir), 'dump')
+    vecs = np.random.random((nr, 5))
+    export_dump_streaming(
+        dump_path,
+        shards=2,
+        size=nr,
+        data=((str(i), vecs[i], f'meta {i}'.encode()) for i in range(nr)),
+    )
+    assert set(os.listdir(os.path.join(dump_path, '0'))) == {
+        'ids',
+        'metas',
+        'vectors.compressed',
+    }
+    for pea_id in range(2):
+        ids_gen, vecs_gen = import_vectors(dump_path, str(pea_id))
+        _, vecs_arr = import_vectors(dump_path, str(pea_id), return_array=True)
+        expected = vecs[pea_id * 5 : (pea_id + 1) * 5]
+        assert list(ids_gen) == [str(i) for i in range(pea_id * 5, (pea_id + 1) * 5)]
+        np.testing.assert_equal(list(vecs_gen), expected)
+        np.testing.assert_equal(vecs_arr, expected)
+
+
+@pytest.mark.parametrize(
+    'second_vec', [np.random.random(3), np.random.random(5).astype(np.float32)]
+)
+def test_dump_compressed_vectors_different_shapes(tmpdir, monkeypatch, second_vec):
+    monkeypatch.setenv('JINA_DUMP_COMPRESSION', 'ZLIB')
+    dump_path = os.path.join(str(tmpdir), 'dump')
+    data = [
+        ('0', np.random.random(5), b'meta 0'),
+        ('1', second_vec, b'meta 1'),
+    ]
+    with pytest.raises(ValueError, match='document 1'):
+        export_dump_streaming(dump_path, shards=1, size=2, data=iter(data))
+    assert not os.path.exists(dump_path)
+
+
+@pytest.mark.parametrize('compression', ['NONE', 'ZLIB'])
+def test_dump_empty_shard(tmpdir, monkeypatch, compression):
+    monkeypatch.setenv('JINA_DUMP_COMPRESSION', compression)
+    dump_path = os.path.join(str(tmpdir), 'dump')
+    vecs = np.random.random((1, 5))
+    export_dump_streaming(
+        dump_path, shards=2, size=1, data=iter([('0', vecs[0], b'meta 0')])
+    )
+    ids_gen, vecs_gen = import_vectors(dump_path, '0')
+    assert list(ids_gen) == []
+    assert list(vecs_gen) == []
+    _, vecs_arr = import_vectors(dump_path, '0', return_array=True)
+    assert vecs_arr.size == 0
+    _, vecs_arr = import_vectors(dump_path, '1', return_array=True)
+    np.testing.assert_equal(vecs_arr, vecs)